@@ -1,7 +1,8 @@
 import logging
+import re
 from typing import Any, Dict
 
-from jsonschema import Draft4Validator, validators
+from jsonschema import Draft4Validator, FormatChecker, validators
 from jsonschema.exceptions import ValidationError, best_match
 
 from freqtrade import constants, OperationalException
@@ -13,9 +14,16 @@ logger = logging.getLogger(__name__)
 def _extend_validator(validator_class):
     """
     Extended validator for the Freqtrade configuration JSON Schema.
-    Currently it only handles defaults for subschemas.
+    It handles defaults for subschemas and speeds up 'required' and
+    'patternProperties' checks by caching frozensets / compiled regexes
+    for the (static) schema.
     """
     validate_properties = validator_class.VALIDATORS['properties']
+    # Cache of frozensets keyed by id() of the schema's 'required' lists.
+    # Values keep a reference to the list itself so the ids stay valid.
+    required_sets: Dict[int, Any] = {}
+    # Compiled patterns of 'patternProperties' keywords (e.g. minimal_roi)
+    pattern_cache: Dict[str, Any] = {}
 
     def set_defaults(validator, properties, instance, schema):
         for prop, subschema in properties.items():
@@ -27,13 +35,63 @@ def _extend_validator(validator_class):
         ):
             yield error
 
+    def validate_required(validator, required, instance, schema):
+        if not validator.is_type(instance, 'object'):
+            return
+        cached = required_sets.get(id(required))
+        if cached is None:
+            cached = required_sets[id(required)] = (required, frozenset(required))
+        if not cached[1].issubset(instance):
+            # Report in schema order to keep jsonschema's error messages stable
+            for prop in required:
+                if prop not in instance:
+                    yield ValidationError(f"{prop!r} is a required property")
+
+    def validate_pattern_properties(validator, pattern_properties, instance, schema):
+        if not validator.is_type(instance, 'object'):
+            return
+        for pattern, subschema in pattern_properties.items():
+            regex = pattern_cache.get(pattern)
+            if regex is None:
+                regex = pattern_cache[pattern] = re.compile(pattern)
+            for key, value in instance.items():
+                if regex.search(key):
+                    for error in validator.descend(
+                        value, subschema, path=key, schema_path=pattern,
+                    ):
+                        yield error
+
     return validators.extend(
-        validator_class, {'properties': set_defaults}
+        validator_class, {
+            'properties': set_defaults,
+            'required': validate_required,
+            'patternProperties': validate_pattern_properties,
+        }
     )
 
 
 FreqtradeValidator = _extend_validator(Draft4Validator)
 
+# Compiled once at import - the schema's "format": "pair" entries reuse this
+# pattern instead of jsonschema recompiling a regex per pair per validation.
+_PAIR_REGEX = re.compile(r'^[0-9A-Z]+/[0-9A-Z]+$')
+
+_FORMAT_CHECKER = FormatChecker()
+
+
+@_FORMAT_CHECKER.checks('pair')
+def _is_pair(value) -> bool:
+    return not isinstance(value, str) or _PAIR_REGEX.match(value) is not None
+
+
+# The schema never changes at runtime - compile the validator once at import
+# instead of on every validate_config_schema call. Meta-schema validation of
+# CONF_SCHEMA itself is covered by a unit test, not done here.
+_CONF_VALIDATOR = FreqtradeValidator(constants.CONF_SCHEMA, format_checker=_FORMAT_CHECKER)
+# Plain Draft4 validator (without defaults injection), used to pick the most
+# relevant error for the exception message.
+_CONF_ERROR_VALIDATOR = Draft4Validator(constants.CONF_SCHEMA, format_checker=_FORMAT_CHECKER)
+
 
 def validate_config_schema(conf: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -42,14 +100,14 @@ def validate_config_schema(conf: Dict[str, Any]) -> Dict[str, Any]:
     :return: Returns the config if valid, otherwise throw an exception
     """
     try:
-        FreqtradeValidator(constants.CONF_SCHEMA).validate(conf)
+        _CONF_VALIDATOR.validate(conf)
         return conf
     except ValidationError as e:
         logger.critical(
             f"Invalid configuration. See config.json.example. Reason: {e}"
         )
         raise ValidationError(
-            best_match(Draft4Validator(constants.CONF_SCHEMA).iter_errors(conf)).message
+            best_match(_CONF_ERROR_VALIDATOR.iter_errors(conf)).message
         )
 
 
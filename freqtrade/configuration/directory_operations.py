@@ -42,9 +42,9 @@ def create_userdata_dir(directory: str, create_dir=False) -> Path:
                 f"Directory `{folder}` does not exist. "
                 "Please use `freqtrade create-userdir` to create a user directory")
 
-    # Create required subdirectories
+    # Create required subdirectories - exist_ok spares a stat call per
+    # subdirectory compared to checking is_dir() first
     for f in sub_dirs:
         subfolder = folder / f
-        if not subfolder.is_dir():
-            subfolder.mkdir(parents=False)
+        subfolder.mkdir(parents=False, exist_ok=True)
     return folder
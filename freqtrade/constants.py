@@ -6,7 +6,6 @@ bot constants
 DEFAULT_CONFIG = 'config.json'
 DEFAULT_EXCHANGE = 'bittrex'
 PROCESS_THROTTLE_SECS = 5  # sec
-DEFAULT_TICKER_INTERVAL = 5  # min
 HYPEROPT_EPOCH = 100  # epochs
 RETRY_TIMEOUT = 30  # sec
 DEFAULT_STRATEGY = 'DefaultStrategy'
@@ -16,27 +15,29 @@ DEFAULT_DB_PROD_URL = 'sqlite:///tradesv3.sqlite'
 DEFAULT_DB_DRYRUN_URL = 'sqlite://'
 UNLIMITED_STAKE_AMOUNT = 'unlimited'
 DEFAULT_AMOUNT_RESERVE_PERCENT = 0.05
-REQUIRED_ORDERTIF = ['buy', 'sell']
-REQUIRED_ORDERTYPES = ['buy', 'sell', 'stoploss', 'stoploss_on_exchange']
+REQUIRED_ORDERTIF = frozenset(['buy', 'sell'])
+REQUIRED_ORDERTYPES = frozenset(['buy', 'sell', 'stoploss', 'stoploss_on_exchange'])
 ORDERTYPE_POSSIBILITIES = ['limit', 'market']
 ORDERTIF_POSSIBILITIES = ['gtc', 'fok', 'ioc']
 AVAILABLE_PAIRLISTS = ['StaticPairList', 'VolumePairList']
 DRY_RUN_WALLET = 999.9
 MATH_CLOSE_PREC = 1e-14  # Precision used for float comparisons
 
-TICKER_INTERVALS = [
+# frozensets for O(1) membership checks; schema enums below use sorted() copies
+# since json-schema requires plain arrays there.
+TICKER_INTERVALS = frozenset([
     '1m', '3m', '5m', '15m', '30m',
     '1h', '2h', '4h', '6h', '8h', '12h',
     '1d', '3d', '1w',
-]
+])
 
-SUPPORTED_FIAT = [
+SUPPORTED_FIAT = frozenset([
     "AUD", "BRL", "CAD", "CHF", "CLP", "CNY", "CZK", "DKK",
     "EUR", "GBP", "HKD", "HUF", "IDR", "ILS", "INR", "JPY",
     "KRW", "MXN", "MYR", "NOK", "NZD", "PHP", "PKR", "PLN",
     "RUB", "SEK", "SGD", "THB", "TRY", "TWD", "ZAR", "USD",
     "BTC", "XBT", "ETH", "XRP", "LTC", "BCH", "USDT"
-]
+])
 
 MINIMAL_CONFIG = {
     'stake_currency': '',
@@ -52,35 +53,44 @@ MINIMAL_CONFIG = {
     }
 }
 
-# Required json-schema for user specified config
+# Shared schema leaves - the schema is immutable, so identical leaf dicts
+# can be one object instead of a dozen copies.
+_BOOLEAN = {'type': 'boolean'}
+_NUMBER = {'type': 'number'}
+_OBJECT = {'type': 'object'}
+_STRING = {'type': 'string'}
+
+# Required json-schema for user specified config.
+# Shared by the validators compiled once in configuration.config_validation -
+# treat it as immutable and never modify it at runtime.
 CONF_SCHEMA = {
     'type': 'object',
     'properties': {
         'max_open_trades': {'type': 'integer', 'minimum': -1},
-        'ticker_interval': {'type': 'string', 'enum': TICKER_INTERVALS},
+        'ticker_interval': {'type': 'string', 'enum': sorted(TICKER_INTERVALS)},
         'stake_currency': {'type': 'string', 'enum': ['BTC', 'XBT', 'ETH', 'USDT', 'EUR', 'USD']},
         'stake_amount': {
             "type": ["number", "string"],
             "minimum": 0.0005,
             "pattern": UNLIMITED_STAKE_AMOUNT
         },
-        'fiat_display_currency': {'type': 'string', 'enum': SUPPORTED_FIAT},
-        'dry_run': {'type': 'boolean'},
-        'dry_run_wallet': {'type': 'number'},
-        'process_only_new_candles': {'type': 'boolean'},
+        'fiat_display_currency': {'type': 'string', 'enum': sorted(SUPPORTED_FIAT)},
+        'dry_run': _BOOLEAN,
+        'dry_run_wallet': _NUMBER,
+        'process_only_new_candles': _BOOLEAN,
         'minimal_roi': {
             'type': 'object',
             'patternProperties': {
-                '^[0-9.]+$': {'type': 'number'}
+                '^[0-9.]+$': _NUMBER
             },
             'minProperties': 1
         },
         'amount_reserve_percent': {'type': 'number', 'minimum': 0.0, 'maximum': 0.5},
         'stoploss': {'type': 'number', 'maximum': 0, 'exclusiveMaximum': True},
-        'trailing_stop': {'type': 'boolean'},
+        'trailing_stop': _BOOLEAN,
         'trailing_stop_positive': {'type': 'number', 'minimum': 0, 'maximum': 1},
         'trailing_stop_positive_offset': {'type': 'number', 'minimum': 0, 'maximum': 1},
-        'trailing_only_offset_is_reached': {'type': 'boolean'},
+        'trailing_only_offset_is_reached': _BOOLEAN,
         'unfilledtimeout': {
             'type': 'object',
             'properties': {
@@ -96,12 +106,12 @@ CONF_SCHEMA = {
                     'minimum': 0,
                     'maximum': 1,
                     'exclusiveMaximum': False,
-                    'use_order_book': {'type': 'boolean'},
+                    'use_order_book': _BOOLEAN,
                     'order_book_top': {'type': 'number', 'maximum': 20, 'minimum': 1},
                     'check_depth_of_market': {
                         'type': 'object',
                         'properties': {
-                            'enabled': {'type': 'boolean'},
+                            'enabled': _BOOLEAN,
                             'bids_to_ask_delta': {'type': 'number', 'minimum': 0},
                         }
                     },
@@ -112,12 +122,12 @@ CONF_SCHEMA = {
         'ask_strategy': {
             'type': 'object',
             'properties': {
-                'use_order_book': {'type': 'boolean'},
+                'use_order_book': _BOOLEAN,
                 'order_book_min': {'type': 'number', 'minimum': 1},
                 'order_book_max': {'type': 'number', 'minimum': 1, 'maximum': 50},
-                'use_sell_signal': {'type': 'boolean'},
-                'sell_profit_only': {'type': 'boolean'},
-                'ignore_roi_if_buy_signal': {'type': 'boolean'}
+                'use_sell_signal': _BOOLEAN,
+                'sell_profit_only': _BOOLEAN,
+                'ignore_roi_if_buy_signal': _BOOLEAN
             }
         },
         'order_types': {
@@ -127,8 +137,8 @@ CONF_SCHEMA = {
                 'sell': {'type': 'string', 'enum': ORDERTYPE_POSSIBILITIES},
                 'emergencysell': {'type': 'string', 'enum': ORDERTYPE_POSSIBILITIES},
                 'stoploss': {'type': 'string', 'enum': ORDERTYPE_POSSIBILITIES},
-                'stoploss_on_exchange': {'type': 'boolean'},
-                'stoploss_on_exchange_interval': {'type': 'number'}
+                'stoploss_on_exchange': _BOOLEAN,
+                'stoploss_on_exchange_interval': _NUMBER
             },
             'required': ['buy', 'sell', 'stoploss', 'stoploss_on_exchange']
         },
@@ -145,62 +155,62 @@ CONF_SCHEMA = {
         'experimental': {
             'type': 'object',
             'properties': {
-                'use_sell_signal': {'type': 'boolean'},
-                'sell_profit_only': {'type': 'boolean'},
-                'ignore_roi_if_buy_signal': {'type': 'boolean'},
-                'block_bad_exchanges': {'type': 'boolean'}
+                'use_sell_signal': _BOOLEAN,
+                'sell_profit_only': _BOOLEAN,
+                'ignore_roi_if_buy_signal': _BOOLEAN,
+                'block_bad_exchanges': _BOOLEAN
             }
         },
         'pairlist': {
             'type': 'object',
             'properties': {
                 'method': {'type': 'string', 'enum': AVAILABLE_PAIRLISTS},
-                'config': {'type': 'object'}
+                'config': _OBJECT
             },
             'required': ['method']
         },
         'telegram': {
             'type': 'object',
             'properties': {
-                'enabled': {'type': 'boolean'},
-                'token': {'type': 'string'},
-                'chat_id': {'type': 'string'},
+                'enabled': _BOOLEAN,
+                'token': _STRING,
+                'chat_id': _STRING,
             },
             'required': ['enabled', 'token', 'chat_id']
         },
         'webhook': {
             'type': 'object',
             'properties': {
-                'enabled': {'type': 'boolean'},
-                'webhookbuy': {'type': 'object'},
-                'webhooksell': {'type': 'object'},
-                'webhookstatus': {'type': 'object'},
+                'enabled': _BOOLEAN,
+                'webhookbuy': _OBJECT,
+                'webhooksell': _OBJECT,
+                'webhookstatus': _OBJECT,
             },
         },
         'api_server': {
             'type': 'object',
             'properties': {
-                'enabled': {'type': 'boolean'},
+                'enabled': _BOOLEAN,
                 'listen_ip_address': {'format': 'ipv4'},
                 'listen_port': {
                     'type': 'integer',
                     "minimum": 1024,
                     "maximum": 65535
                 },
-                'username': {'type': 'string'},
-                'password': {'type': 'string'},
+                'username': _STRING,
+                'password': _STRING,
             },
             'required': ['enabled', 'listen_ip_address', 'listen_port', 'username', 'password']
         },
-        'db_url': {'type': 'string'},
+        'db_url': _STRING,
         'initial_state': {'type': 'string', 'enum': ['running', 'stopped']},
-        'forcebuy_enable': {'type': 'boolean'},
+        'forcebuy_enable': _BOOLEAN,
         'internals': {
             'type': 'object',
             'properties': {
-                'process_throttle_secs': {'type': 'number'},
+                'process_throttle_secs': _NUMBER,
                 'interval': {'type': 'integer'},
-                'sd_notify': {'type': 'boolean'},
+                'sd_notify': _BOOLEAN,
             }
         }
     },
@@ -208,17 +218,17 @@ CONF_SCHEMA = {
         'exchange': {
             'type': 'object',
             'properties': {
-                'name': {'type': 'string'},
+                'name': _STRING,
                 'sandbox': {'type': 'boolean', 'default': False},
                 'key': {'type': 'string', 'default': ''},
                 'secret': {'type': 'string', 'default': ''},
                 'password': {'type': 'string', 'default': ''},
-                'uid': {'type': 'string'},
+                'uid': _STRING,
                 'pair_whitelist': {
                     'type': 'array',
                     'items': {
                         'type': 'string',
-                        'pattern': '^[0-9A-Z]+/[0-9A-Z]+$'
+                        'format': 'pair'
                     },
                     'uniqueItems': True
                 },
@@ -226,33 +236,33 @@ CONF_SCHEMA = {
                     'type': 'array',
                     'items': {
                         'type': 'string',
-                        'pattern': '^[0-9A-Z]+/[0-9A-Z]+$'
+                        'format': 'pair'
                     },
                     'uniqueItems': True
                 },
                 'outdated_offset': {'type': 'integer', 'minimum': 1},
                 'markets_refresh_interval': {'type': 'integer'},
-                'ccxt_config': {'type': 'object'},
-                'ccxt_async_config': {'type': 'object'}
+                'ccxt_config': _OBJECT,
+                'ccxt_async_config': _OBJECT
             },
             'required': ['name']
         },
         'edge': {
             'type': 'object',
             'properties': {
-                "enabled": {'type': 'boolean'},
+                "enabled": _BOOLEAN,
                 "process_throttle_secs": {'type': 'integer', 'minimum': 600},
                 "calculate_since_number_of_days": {'type': 'integer'},
-                "allowed_risk": {'type': 'number'},
-                "capital_available_percentage": {'type': 'number'},
-                "stoploss_range_min": {'type': 'number'},
-                "stoploss_range_max": {'type': 'number'},
-                "stoploss_range_step": {'type': 'number'},
-                "minimum_winrate": {'type': 'number'},
-                "minimum_expectancy": {'type': 'number'},
-                "min_trade_number": {'type': 'number'},
+                "allowed_risk": _NUMBER,
+                "capital_available_percentage": _NUMBER,
+                "stoploss_range_min": _NUMBER,
+                "stoploss_range_max": _NUMBER,
+                "stoploss_range_step": _NUMBER,
+                "minimum_winrate": _NUMBER,
+                "minimum_expectancy": _NUMBER,
+                "min_trade_number": _NUMBER,
                 "max_trade_duration_minute": {'type': 'integer'},
-                "remove_pumps": {'type': 'boolean'}
+                "remove_pumps": _BOOLEAN
             },
             'required': ['process_throttle_secs', 'allowed_risk', 'capital_available_percentage']
         }
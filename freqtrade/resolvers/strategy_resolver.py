@@ -106,11 +106,11 @@ class StrategyResolver(IResolver):
             config[attribute] = default
 
     def _strategy_sanity_validations(self):
-        if not all(k in self.strategy.order_types for k in constants.REQUIRED_ORDERTYPES):
+        if not constants.REQUIRED_ORDERTYPES.issubset(self.strategy.order_types):
             raise ImportError(f"Impossible to load Strategy '{self.strategy.__class__.__name__}'. "
                               f"Order-types mapping is incomplete.")
 
-        if not all(k in self.strategy.order_time_in_force for k in constants.REQUIRED_ORDERTIF):
+        if not constants.REQUIRED_ORDERTIF.issubset(self.strategy.order_time_in_force):
             raise ImportError(f"Impossible to load Strategy '{self.strategy.__class__.__name__}'. "
                               f"Order-time-in-force mapping is incomplete.")
 
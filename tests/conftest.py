@@ -1,10 +1,10 @@
 # pragma pylint: disable=missing-docstring
 import json
 import logging
+import pickle
 import re
 from copy import deepcopy
 from datetime import datetime
-from functools import reduce
 from pathlib import Path
 from unittest.mock import MagicMock, PropertyMock
 
@@ -33,19 +33,27 @@ np.seterr(all='raise')
 def log_has(line, logs):
     # caplog mocker returns log as a tuple: ('freqtrade.something', logging.WARNING, 'foobar')
     # and we want to match line against foobar in the tuple
-    return reduce(lambda a, b: a or b,
-                  filter(lambda x: x[2] == line, logs.record_tuples),
-                  False)
+    return any(line == message for _, _, message in logs.record_tuples)
 
 
 def log_has_re(line, logs):
-    return reduce(lambda a, b: a or b,
-                  filter(lambda x: re.match(line, x[2]), logs.record_tuples),
-                  False)
+    # Compile once instead of letting re.match look the pattern up per record
+    pattern = re.compile(line)
+    return any(pattern.match(message) for _, _, message in logs.record_tuples)
+
+
+# Parsed-argument cache for get_args - parsing the same argv repeatedly
+# (most tests pass the same few lists) only pays for argparse once.
+_parsed_args_cache: dict = {}
 
 
 def get_args(args):
-    return Arguments(args).get_parsed_arg()
+    key = tuple(args)
+    parsed = _parsed_args_cache.get(key)
+    if parsed is None:
+        parsed = _parsed_args_cache[key] = Arguments(args).get_parsed_arg()
+    # Hand out a copy - some tests mutate the result
+    return dict(parsed)
 
 
 def patched_configuration_load_config_file(mocker, config) -> None:
@@ -191,9 +199,9 @@ def init_persistence(default_conf):
     persistence.init(default_conf['db_url'], default_conf['dry_run'])
 
 
-@pytest.fixture(scope="function")
-def default_conf(testdatadir):
-    """ Returns validated configuration suitable for most tests """
+@pytest.fixture(scope="session")
+def _default_conf_pickled(testdatadir):
+    """ Pickled configuration template, built once per session """
     configuration = {
         "max_open_trades": 1,
         "stake_currency": "BTC",
@@ -253,7 +261,14 @@ def default_conf(testdatadir):
         "user_data_dir": Path("user_data"),
         "verbosity": 3,
     }
-    return configuration
+    return pickle.dumps(configuration, pickle.HIGHEST_PROTOCOL)
+
+
+@pytest.fixture(scope="function")
+def default_conf(_default_conf_pickled):
+    """ Returns validated configuration suitable for most tests """
+    # Unpickling clones the template faster than rebuilding or deepcopying it
+    return pickle.loads(_default_conf_pickled)
 
 
 @pytest.fixture
@@ -1215,7 +1230,7 @@ def rpc_balance():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def testdatadir() -> Path:
     """Return the path where testdata files are stored"""
     return (Path(__file__).parent / "testdata").resolve()
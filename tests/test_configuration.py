@@ -7,10 +7,11 @@ from pathlib import Path
 from unittest.mock import MagicMock
 
 import pytest
+import rapidjson
 from jsonschema import Draft4Validator, ValidationError, validate
 
 from freqtrade import OperationalException, constants
-from freqtrade.configuration import (Arguments, Configuration, check_exchange,
+from freqtrade.configuration import (Configuration, check_exchange,
                                      remove_credentials,
                                      validate_config_consistency)
 from freqtrade.configuration.config_validation import validate_config_schema
@@ -23,21 +24,33 @@ from freqtrade.configuration.load_config import load_config_file
 from freqtrade.constants import DEFAULT_DB_DRYRUN_URL, DEFAULT_DB_PROD_URL
 from freqtrade.loggers import _set_loggers
 from freqtrade.state import RunMode
-from tests.conftest import (log_has, log_has_re,
+from tests.conftest import (get_args, log_has, log_has_re,
                             patched_configuration_load_config_file)
 
 
-@pytest.fixture(scope="function")
-def all_conf():
+@pytest.fixture(scope="session")
+def _all_conf_cached():
     config_file = Path(__file__).parents[1] / "config_full.json.example"
-    conf = load_config_file(str(config_file))
-    return conf
+    return load_config_file(str(config_file))
+
+
+@pytest.fixture(scope="function")
+def all_conf(_all_conf_cached):
+    # Tests mutate the conf, so parse the file once per session
+    # and hand each test its own copy.
+    return deepcopy(_all_conf_cached)
+
+
+def test_conf_schema_is_valid() -> None:
+    # The bot skips meta-schema validation at runtime, so catch schema
+    # mistakes here instead.
+    Draft4Validator.check_schema(constants.CONF_SCHEMA)
 
 
 def test_load_config_invalid_pair(default_conf) -> None:
     default_conf['exchange']['pair_whitelist'].append('ETH-BTC')
 
-    with pytest.raises(ValidationError, match=r'.*does not match.*'):
+    with pytest.raises(ValidationError, match=r".*is not a 'pair'.*"):
         validate_config_schema(default_conf)
 
 
@@ -69,7 +82,7 @@ def test_load_config_file(default_conf, mocker, caplog) -> None:
 def test__args_to_config(caplog):
 
     arg_list = ['--strategy-path', 'TestTest']
-    args = Arguments(arg_list).get_parsed_arg()
+    args = get_args(arg_list)
     configuration = Configuration(args)
     config = {}
     with warnings.catch_warnings(record=True) as w:
@@ -96,7 +109,7 @@ def test_load_config_max_open_trades_zero(default_conf, mocker, caplog) -> None:
     default_conf['max_open_trades'] = 0
     patched_configuration_load_config_file(mocker, default_conf)
 
-    args = Arguments([]).get_parsed_arg()
+    args = get_args([])
     configuration = Configuration(args)
     validated_conf = configuration.load_config()
 
@@ -115,14 +128,14 @@ def test_load_config_combine_dicts(default_conf, mocker, caplog) -> None:
 
     config_files = [conf1, conf2]
 
-    configsmock = MagicMock(side_effect=config_files)
+    config_files_iter = iter(config_files)
     mocker.patch(
         'freqtrade.configuration.configuration.load_config_file',
-        configsmock
+        lambda *args, **kwargs: next(config_files_iter)
     )
 
     arg_list = ['-c', 'test_conf.json', '--config', 'test2_conf.json', ]
-    args = Arguments(arg_list).get_parsed_arg()
+    args = get_args(arg_list)
     configuration = Configuration(args)
     validated_conf = configuration.load_config()
 
@@ -148,8 +161,9 @@ def test_from_config(default_conf, mocker, caplog) -> None:
     config_files = [conf1, conf2]
     mocker.patch('freqtrade.configuration.configuration.create_datadir', lambda c, x: x)
 
-    configsmock = MagicMock(side_effect=config_files)
-    mocker.patch('freqtrade.configuration.configuration.load_config_file', configsmock)
+    config_files_iter = iter(config_files)
+    mocker.patch('freqtrade.configuration.configuration.load_config_file',
+                 lambda *args, **kwargs: next(config_files_iter))
 
     validated_conf = Configuration.from_files(['test_conf.json', 'test2_conf.json'])
 
@@ -171,23 +185,26 @@ def test_print_config(default_conf, mocker, caplog) -> None:
     del conf1['user_data_dir']
     config_files = [conf1]
 
-    configsmock = MagicMock(side_effect=config_files)
+    config_files_iter = iter(config_files)
     mocker.patch('freqtrade.configuration.configuration.create_datadir', lambda c, x: x)
-    mocker.patch('freqtrade.configuration.configuration.load_config_file', configsmock)
+    mocker.patch('freqtrade.configuration.configuration.load_config_file',
+                 lambda *args, **kwargs: next(config_files_iter))
 
     validated_conf = Configuration.from_files(['test_conf.json'])
 
     assert isinstance(validated_conf['user_data_dir'], Path)
     assert "user_data_dir" in validated_conf
     assert "original_config" in validated_conf
-    assert isinstance(json.dumps(validated_conf['original_config']), str)
+    # Smoke check that the original config stays JSON-serializable -
+    # rapidjson is what the bot itself serializes with
+    assert isinstance(rapidjson.dumps(validated_conf['original_config']), str)
 
 
 def test_load_config_max_open_trades_minus_one(default_conf, mocker, caplog) -> None:
     default_conf['max_open_trades'] = -1
     patched_configuration_load_config_file(mocker, default_conf)
 
-    args = Arguments([]).get_parsed_arg()
+    args = get_args([])
     configuration = Configuration(args)
     validated_conf = configuration.load_config()
 
@@ -211,7 +228,7 @@ def test_load_config_file_exception(mocker) -> None:
 def test_load_config(default_conf, mocker) -> None:
     patched_configuration_load_config_file(mocker, default_conf)
 
-    args = Arguments([]).get_parsed_arg()
+    args = get_args([])
     configuration = Configuration(args)
     validated_conf = configuration.load_config()
 
@@ -228,7 +245,7 @@ def test_load_config_with_params(default_conf, mocker) -> None:
         '--strategy-path', '/some/path',
         '--db-url', 'sqlite:///someurl',
     ]
-    args = Arguments(arglist).get_parsed_arg()
+    args = get_args(arglist)
     configuration = Configuration(args)
     validated_conf = configuration.load_config()
 
@@ -236,71 +253,36 @@ def test_load_config_with_params(default_conf, mocker) -> None:
     assert validated_conf.get('strategy_path') == '/some/path'
     assert validated_conf.get('db_url') == 'sqlite:///someurl'
 
-    # Test conf provided db_url prod
-    conf = default_conf.copy()
-    conf["dry_run"] = False
-    conf["db_url"] = "sqlite:///path/to/db.sqlite"
-    patched_configuration_load_config_file(mocker, conf)
-
-    arglist = [
-        '--strategy', 'TestStrategy',
-        '--strategy-path', '/some/path'
-    ]
-    args = Arguments(arglist).get_parsed_arg()
-
-    configuration = Configuration(args)
-    validated_conf = configuration.load_config()
-    assert validated_conf.get('db_url') == "sqlite:///path/to/db.sqlite"
 
+@pytest.mark.parametrize("dry_run,db_url,expected", [
+    # Test conf provided db_url prod
+    (False, "sqlite:///path/to/db.sqlite", "sqlite:///path/to/db.sqlite"),
     # Test conf provided db_url dry_run
-    conf = default_conf.copy()
-    conf["dry_run"] = True
-    conf["db_url"] = "sqlite:///path/to/db.sqlite"
-    patched_configuration_load_config_file(mocker, conf)
-
-    arglist = [
-        '--strategy', 'TestStrategy',
-        '--strategy-path', '/some/path'
-    ]
-    args = Arguments(arglist).get_parsed_arg()
-
-    configuration = Configuration(args)
-    validated_conf = configuration.load_config()
-    assert validated_conf.get('db_url') == "sqlite:///path/to/db.sqlite"
-
+    (True, "sqlite:///path/to/db.sqlite", "sqlite:///path/to/db.sqlite"),
     # Test args provided db_url prod
-    conf = default_conf.copy()
-    conf["dry_run"] = False
-    del conf["db_url"]
-    patched_configuration_load_config_file(mocker, conf)
-
-    arglist = [
-        '--strategy', 'TestStrategy',
-        '--strategy-path', '/some/path'
-    ]
-    args = Arguments(arglist).get_parsed_arg()
-
-    configuration = Configuration(args)
-    validated_conf = configuration.load_config()
-    assert validated_conf.get('db_url') == DEFAULT_DB_PROD_URL
-    assert "runmode" in validated_conf
-    assert validated_conf['runmode'] == RunMode.LIVE
-
+    (False, None, DEFAULT_DB_PROD_URL),
     # Test args provided db_url dry_run
-    conf = default_conf.copy()
-    conf["dry_run"] = True
-    conf["db_url"] = DEFAULT_DB_PROD_URL
-    patched_configuration_load_config_file(mocker, conf)
+    (True, DEFAULT_DB_PROD_URL, DEFAULT_DB_DRYRUN_URL),
+])
+def test_load_config_db_url(default_conf, mocker, dry_run, db_url, expected) -> None:
+    default_conf["dry_run"] = dry_run
+    if db_url is not None:
+        default_conf["db_url"] = db_url
+    else:
+        del default_conf["db_url"]
+    patched_configuration_load_config_file(mocker, default_conf)
 
     arglist = [
         '--strategy', 'TestStrategy',
         '--strategy-path', '/some/path'
     ]
-    args = Arguments(arglist).get_parsed_arg()
+    args = get_args(arglist)
 
     configuration = Configuration(args)
     validated_conf = configuration.load_config()
-    assert validated_conf.get('db_url') == DEFAULT_DB_DRYRUN_URL
+    assert validated_conf.get('db_url') == expected
+    assert "runmode" in validated_conf
+    assert validated_conf['runmode'] == (RunMode.DRY_RUN if dry_run else RunMode.LIVE)
 
 
 def test_load_custom_strategy(default_conf, mocker) -> None:
@@ -310,7 +292,7 @@ def test_load_custom_strategy(default_conf, mocker) -> None:
     })
     patched_configuration_load_config_file(mocker, default_conf)
 
-    args = Arguments([]).get_parsed_arg()
+    args = get_args([])
     configuration = Configuration(args)
     validated_conf = configuration.load_config()
 
@@ -325,7 +307,7 @@ def test_show_info(default_conf, mocker, caplog) -> None:
         '--strategy', 'TestStrategy',
         '--db-url', 'sqlite:///tmp/testdb',
     ]
-    args = Arguments(arglist).get_parsed_arg()
+    args = get_args(arglist)
 
     configuration = Configuration(args)
     configuration.get_config()
@@ -343,7 +325,7 @@ def test_setup_configuration_without_arguments(mocker, default_conf, caplog) ->
         'backtesting'
     ]
 
-    args = Arguments(arglist).get_parsed_arg()
+    args = get_args(arglist)
 
     configuration = Configuration(args)
     config = configuration.get_config()
@@ -388,7 +370,7 @@ def test_setup_configuration_with_arguments(mocker, default_conf, caplog) -> Non
         '--export', '/bar/foo'
     ]
 
-    args = Arguments(arglist).get_parsed_arg()
+    args = get_args(arglist)
 
     configuration = Configuration(args)
     config = configuration.get_config()
@@ -436,7 +418,7 @@ def test_setup_configuration_with_stratlist(mocker, default_conf, caplog) -> Non
         'TestStrategy'
     ]
 
-    args = Arguments(arglist).get_parsed_arg()
+    args = get_args(arglist)
 
     configuration = Configuration(args, RunMode.BACKTEST)
     config = configuration.get_config()
@@ -473,7 +455,7 @@ def test_hyperopt_with_arguments(mocker, default_conf, caplog) -> None:
         '--epochs', '10',
         '--spaces', 'all',
     ]
-    args = Arguments(arglist).get_parsed_arg()
+    args = get_args(arglist)
 
     configuration = Configuration(args, RunMode.HYPEROPT)
     config = configuration.get_config()
@@ -490,66 +472,56 @@ def test_hyperopt_with_arguments(mocker, default_conf, caplog) -> None:
     assert config['runmode'] == RunMode.HYPEROPT
 
 
-def test_check_exchange(default_conf, caplog) -> None:
-    # Test an officially supported by Freqtrade team exchange
+@pytest.mark.parametrize("exchange,check_for_bad,log_re", [
+    # Officially supported by the Freqtrade team
+    ('BITTREX', True,
+     r"Exchange .* is officially supported by the Freqtrade development team\."),
+    # Officially supported by the Freqtrade team
+    ('binance', True,
+     r"Exchange .* is officially supported by the Freqtrade development team\."),
+    # Available exchange, supported by ccxt
+    ('huobipro', True,
+     r"Exchange .* is known to the the ccxt library, available for the bot, "
+     r"but not officially supported "
+     r"by the Freqtrade development team\. .*"),
+    # 'bad' exchange, but check_for_bad=False
+    ('bitmex', False,
+     r"Exchange .* is known to the the ccxt library, available for the bot, "
+     r"but not officially supported "
+     r"by the Freqtrade development team\. .*"),
+])
+def test_check_exchange(default_conf, caplog, exchange, check_for_bad, log_re) -> None:
     default_conf['runmode'] = RunMode.DRY_RUN
-    default_conf.get('exchange').update({'name': 'BITTREX'})
-    assert check_exchange(default_conf)
-    assert log_has_re(r"Exchange .* is officially supported by the Freqtrade development team\.",
-                      caplog)
-    caplog.clear()
-
-    # Test an officially supported by Freqtrade team exchange
-    default_conf.get('exchange').update({'name': 'binance'})
-    assert check_exchange(default_conf)
-    assert log_has_re(r"Exchange .* is officially supported by the Freqtrade development team\.",
-                      caplog)
-    caplog.clear()
-
-    # Test an available exchange, supported by ccxt
-    default_conf.get('exchange').update({'name': 'huobipro'})
-    assert check_exchange(default_conf)
-    assert log_has_re(r"Exchange .* is known to the the ccxt library, available for the bot, "
-                      r"but not officially supported "
-                      r"by the Freqtrade development team\. .*", caplog)
-    caplog.clear()
-
-    # Test a 'bad' exchange, which known to have serious problems
-    default_conf.get('exchange').update({'name': 'bitmex'})
-    with pytest.raises(OperationalException,
-                       match=r"Exchange .* is known to not work with the bot yet.*"):
+    default_conf.get('exchange').update({'name': exchange})
+    assert check_exchange(default_conf, check_for_bad)
+    assert log_has_re(log_re, caplog)
+
+
+@pytest.mark.parametrize("exchange,runmode,error_re", [
+    # 'bad' exchange, which known to have serious problems
+    ('bitmex', RunMode.DRY_RUN,
+     r"Exchange .* is known to not work with the bot yet.*"),
+    # Invalid exchange
+    ('unknown_exchange', RunMode.DRY_RUN,
+     r'Exchange "unknown_exchange" is not known to the ccxt library '
+     r'and therefore not available for the bot.*'),
+    # No exchange in a runmode that requires one
+    ('', RunMode.UTIL_EXCHANGE,
+     r'This command requires a configured exchange.*'),
+])
+def test_check_exchange_error(default_conf, exchange, runmode, error_re) -> None:
+    default_conf['runmode'] = runmode
+    default_conf.get('exchange').update({'name': exchange})
+    with pytest.raises(OperationalException, match=error_re):
         check_exchange(default_conf)
-    caplog.clear()
-
-    # Test a 'bad' exchange with check_for_bad=False
-    default_conf.get('exchange').update({'name': 'bitmex'})
-    assert check_exchange(default_conf, False)
-    assert log_has_re(r"Exchange .* is known to the the ccxt library, available for the bot, "
-                      r"but not officially supported "
-                      r"by the Freqtrade development team\. .*", caplog)
-    caplog.clear()
 
-    # Test an invalid exchange
-    default_conf.get('exchange').update({'name': 'unknown_exchange'})
-    with pytest.raises(
-        OperationalException,
-        match=r'Exchange "unknown_exchange" is not known to the ccxt library '
-              r'and therefore not available for the bot.*'
-    ):
-        check_exchange(default_conf)
 
-    # Test no exchange...
+def test_check_exchange_skipped_for_plot(default_conf) -> None:
+    # No exchange configured is fine when only plotting
     default_conf.get('exchange').update({'name': ''})
     default_conf['runmode'] = RunMode.PLOT
     assert check_exchange(default_conf)
 
-    # Test no exchange...
-    default_conf.get('exchange').update({'name': ''})
-    default_conf['runmode'] = RunMode.UTIL_EXCHANGE
-    with pytest.raises(OperationalException,
-                       match=r'This command requires a configured exchange.*'):
-        check_exchange(default_conf)
-
 
 def test_remove_credentials(default_conf, caplog) -> None:
     conf = deepcopy(default_conf)
@@ -569,7 +541,7 @@ def test_cli_verbose_with_params(default_conf, mocker, caplog) -> None:
     # Prevent setting loggers
     mocker.patch('freqtrade.loggers._set_loggers', MagicMock)
     arglist = ['-vvv']
-    args = Arguments(arglist).get_parsed_arg()
+    args = get_args(arglist)
 
     configuration = Configuration(args)
     validated_conf = configuration.load_config()
@@ -578,65 +550,54 @@ def test_cli_verbose_with_params(default_conf, mocker, caplog) -> None:
     assert log_has('Verbosity set to 3', caplog)
 
 
-def test_set_loggers() -> None:
+@pytest.mark.parametrize("verbosity,expected_levels", [
+    (0, {'requests': logging.INFO,
+         'urllib3': logging.INFO,
+         'ccxt.base.exchange': logging.INFO,
+         'telegram': logging.INFO}),
+    (2, {'requests': logging.DEBUG,
+         'urllib3': logging.DEBUG,
+         'ccxt.base.exchange': logging.INFO,
+         'telegram': logging.INFO}),
+    (3, {'requests': logging.DEBUG,
+         'urllib3': logging.DEBUG,
+         'ccxt.base.exchange': logging.DEBUG,
+         'telegram': logging.INFO}),
+])
+def test_set_loggers(verbosity, expected_levels) -> None:
     # Reset Logging to Debug, otherwise this fails randomly as it's set globally
-    logging.getLogger('requests').setLevel(logging.DEBUG)
-    logging.getLogger("urllib3").setLevel(logging.DEBUG)
-    logging.getLogger('ccxt.base.exchange').setLevel(logging.DEBUG)
-    logging.getLogger('telegram').setLevel(logging.DEBUG)
-
-    previous_value1 = logging.getLogger('requests').level
-    previous_value2 = logging.getLogger('ccxt.base.exchange').level
-    previous_value3 = logging.getLogger('telegram').level
-
-    _set_loggers()
-
-    value1 = logging.getLogger('requests').level
-    assert previous_value1 is not value1
-    assert value1 is logging.INFO
-
-    value2 = logging.getLogger('ccxt.base.exchange').level
-    assert previous_value2 is not value2
-    assert value2 is logging.INFO
-
-    value3 = logging.getLogger('telegram').level
-    assert previous_value3 is not value3
-    assert value3 is logging.INFO
+    for logger_name in expected_levels:
+        logging.getLogger(logger_name).setLevel(logging.DEBUG)
 
-    _set_loggers(verbosity=2)
+    _set_loggers(verbosity)
 
-    assert logging.getLogger('requests').level is logging.DEBUG
-    assert logging.getLogger('ccxt.base.exchange').level is logging.INFO
-    assert logging.getLogger('telegram').level is logging.INFO
-
-    _set_loggers(verbosity=3)
-
-    assert logging.getLogger('requests').level is logging.DEBUG
-    assert logging.getLogger('ccxt.base.exchange').level is logging.DEBUG
-    assert logging.getLogger('telegram').level is logging.INFO
+    levels = {logger_name: logging.getLogger(logger_name).level
+              for logger_name in expected_levels}
+    assert levels == expected_levels
 
 
 def test_set_logfile(default_conf, mocker):
     patched_configuration_load_config_file(mocker, default_conf)
+    # Don't create a real logfile on disk
+    filehandler_mock = mocker.patch('freqtrade.loggers.RotatingFileHandler')
 
     arglist = [
         '--logfile', 'test_file.log',
     ]
-    args = Arguments(arglist).get_parsed_arg()
+    args = get_args(arglist)
     configuration = Configuration(args)
     validated_conf = configuration.load_config()
 
     assert validated_conf['logfile'] == "test_file.log"
-    f = Path("test_file.log")
-    assert f.is_file()
-    f.unlink()
+    assert filehandler_mock.call_count == 1
+    assert filehandler_mock.call_args[0][0] == "test_file.log"
 
 
 def test_load_config_warn_forcebuy(default_conf, mocker, caplog) -> None:
     default_conf['forcebuy_enable'] = True
     patched_configuration_load_config_file(mocker, default_conf)
 
-    args = Arguments([]).get_parsed_arg()
+    args = get_args([])
     configuration = Configuration(args)
     validated_conf = configuration.load_config()
 
@@ -658,28 +619,31 @@ def test_create_datadir(mocker, default_conf, caplog) -> None:
 
 
 def test_create_userdata_dir(mocker, default_conf, caplog) -> None:
-    mocker.patch.object(Path, "is_dir", MagicMock(return_value=False))
-    md = mocker.patch.object(Path, 'mkdir', MagicMock())
+    md = MagicMock()
+    mocker.patch.multiple(Path, is_dir=MagicMock(return_value=False), mkdir=md)
 
     x = create_userdata_dir('/tmp/bar', create_dir=True)
     assert md.call_count == 7
     assert md.call_args[1]['parents'] is False
+    assert md.call_args[1]['exist_ok'] is True
     assert log_has(f'Created user-data directory: {Path("/tmp/bar")}', caplog)
     assert isinstance(x, Path)
     assert str(x) == str(Path("/tmp/bar"))
 
 
 def test_create_userdata_dir_exists(mocker, default_conf, caplog) -> None:
-    mocker.patch.object(Path, "is_dir", MagicMock(return_value=True))
-    md = mocker.patch.object(Path, 'mkdir', MagicMock())
+    md = MagicMock()
+    mocker.patch.multiple(Path, is_dir=MagicMock(return_value=True), mkdir=md)
 
     create_userdata_dir('/tmp/bar')
-    assert md.call_count == 0
+    # Only the subdirectories are (idempotently) created - not the parent
+    assert md.call_count == 6
+    assert md.call_args[1]['exist_ok'] is True
 
 
 def test_create_userdata_dir_exists_exception(mocker, default_conf, caplog) -> None:
-    mocker.patch.object(Path, "is_dir", MagicMock(return_value=False))
-    md = mocker.patch.object(Path, 'mkdir', MagicMock())
+    md = MagicMock()
+    mocker.patch.multiple(Path, is_dir=MagicMock(return_value=False), mkdir=md)
 
     with pytest.raises(OperationalException,
                        match=r'Directory `.{1,2}tmp.{1,2}bar` does not exist.*'):
@@ -835,7 +799,7 @@ def test_pairlist_resolving():
         '--exchange', 'binance'
     ]
 
-    args = Arguments(arglist).get_parsed_arg()
+    args = get_args(arglist)
 
     configuration = Configuration(args, RunMode.OTHER)
     config = configuration.get_config()
@@ -851,7 +815,7 @@ def test_pairlist_resolving_with_config(mocker, default_conf):
         'download-data',
     ]
 
-    args = Arguments(arglist).get_parsed_arg()
+    args = get_args(arglist)
 
     configuration = Configuration(args)
     config = configuration.get_config()
@@ -866,7 +830,7 @@ def test_pairlist_resolving_with_config(mocker, default_conf):
         '--pairs', 'ETH/BTC', 'XRP/BTC',
     ]
 
-    args = Arguments(arglist).get_parsed_arg()
+    args = get_args(arglist)
 
     configuration = Configuration(args)
     config = configuration.get_config()
@@ -888,7 +852,7 @@ def test_pairlist_resolving_with_config_pl(mocker, default_conf):
         '--pairs-file', 'pairs.json',
     ]
 
-    args = Arguments(arglist).get_parsed_arg()
+    args = get_args(arglist)
 
     configuration = Configuration(args)
     config = configuration.get_config()
@@ -910,7 +874,7 @@ def test_pairlist_resolving_with_config_pl_not_exists(mocker, default_conf):
         '--pairs-file', 'pairs.json',
     ]
 
-    args = Arguments(arglist).get_parsed_arg()
+    args = get_args(arglist)
 
     with pytest.raises(OperationalException, match=r"No pairs file found with path.*"):
         configuration = Configuration(args)
@@ -927,7 +891,7 @@ def test_pairlist_resolving_fallback(mocker):
         '--exchange', 'binance'
     ]
 
-    args = Arguments(arglist).get_parsed_arg()
+    args = get_args(arglist)
     # Fix flaky tests if config.json exists
     args["config"] = None
 
@@ -975,88 +939,67 @@ def test_process_temporary_deprecated_settings(mocker, default_conf, setting, ca
     assert default_conf[setting[0]][setting[1]] == setting[5]
 
 
-def test_check_conflicting_settings(mocker, default_conf, caplog):
+@pytest.mark.parametrize("new_value,deprecated_value,expected_value", [
+    # New and deprecated settings are conflicting ones
+    ('valA', 'valB', None),
+    # Only deprecated setting exists
+    (None, 'valB', None),
+    # Only new setting exists
+    ('valA', None, 'valA'),
+])
+def test_check_conflicting_settings(mocker, default_conf, caplog,
+                                    new_value, deprecated_value, expected_value):
     patched_configuration_load_config_file(mocker, default_conf)
 
     # Create sections for new and deprecated settings
     # (they may not exist in the config)
     default_conf['sectionA'] = {}
     default_conf['sectionB'] = {}
-    # Assign new setting
-    default_conf['sectionA']['new_setting'] = 'valA'
-    # Assign deprecated setting
-    default_conf['sectionB']['deprecated_setting'] = 'valB'
-
-    # New and deprecated settings are conflicting ones
-    with pytest.raises(OperationalException, match=r'DEPRECATED'):
+    if new_value is not None:
+        default_conf['sectionA']['new_setting'] = new_value
+    if deprecated_value is not None:
+        default_conf['sectionB']['deprecated_setting'] = deprecated_value
+
+    if new_value is not None and deprecated_value is not None:
+        with pytest.raises(OperationalException, match=r'DEPRECATED'):
+            check_conflicting_settings(default_conf,
+                                       'sectionA', 'new_setting',
+                                       'sectionB', 'deprecated_setting')
+    else:
         check_conflicting_settings(default_conf,
                                    'sectionA', 'new_setting',
                                    'sectionB', 'deprecated_setting')
-
-    caplog.clear()
-
-    # Delete new setting (deprecated exists)
-    del default_conf['sectionA']['new_setting']
-    check_conflicting_settings(default_conf,
-                               'sectionA', 'new_setting',
-                               'sectionB', 'deprecated_setting')
-    assert not log_has_re('DEPRECATED', caplog)
-    assert 'new_setting' not in default_conf['sectionA']
-
-    caplog.clear()
-
-    # Assign new setting
-    default_conf['sectionA']['new_setting'] = 'valA'
-    # Delete deprecated setting
-    del default_conf['sectionB']['deprecated_setting']
-    check_conflicting_settings(default_conf,
-                               'sectionA', 'new_setting',
-                               'sectionB', 'deprecated_setting')
-    assert not log_has_re('DEPRECATED', caplog)
-    assert default_conf['sectionA']['new_setting'] == 'valA'
-
-
-def test_process_deprecated_setting(mocker, default_conf, caplog):
+        assert not log_has_re('DEPRECATED', caplog)
+        if expected_value is None:
+            assert 'new_setting' not in default_conf['sectionA']
+        else:
+            assert default_conf['sectionA']['new_setting'] == expected_value
+
+
+@pytest.mark.parametrize("new_value,deprecated_value,deprecated_log,expected_value", [
+    # Both new and deprecated settings exist - deprecated wins
+    ('valA', 'valB', True, 'valB'),
+    # Only deprecated setting exists - its value is moved
+    (None, 'valB', True, 'valB'),
+    # Only new setting exists - nothing to do
+    ('valA', None, False, 'valA'),
+])
+def test_process_deprecated_setting(mocker, default_conf, caplog,
+                                    new_value, deprecated_value, deprecated_log, expected_value):
     patched_configuration_load_config_file(mocker, default_conf)
 
     # Create sections for new and deprecated settings
     # (they may not exist in the config)
     default_conf['sectionA'] = {}
     default_conf['sectionB'] = {}
-    # Assign new setting
-    default_conf['sectionA']['new_setting'] = 'valA'
-    # Assign deprecated setting
-    default_conf['sectionB']['deprecated_setting'] = 'valB'
+    if new_value is not None:
+        default_conf['sectionA']['new_setting'] = new_value
+    if deprecated_value is not None:
+        default_conf['sectionB']['deprecated_setting'] = deprecated_value
 
-    # Both new and deprecated settings exists
     process_deprecated_setting(default_conf,
                                'sectionA', 'new_setting',
                                'sectionB', 'deprecated_setting')
-    assert log_has_re('DEPRECATED', caplog)
-    # The value of the new setting shall have been set to the
-    # value of the deprecated one
-    assert default_conf['sectionA']['new_setting'] == 'valB'
-
-    caplog.clear()
 
-    # Delete new setting (deprecated exists)
-    del default_conf['sectionA']['new_setting']
-    process_deprecated_setting(default_conf,
-                               'sectionA', 'new_setting',
-                               'sectionB', 'deprecated_setting')
-    assert log_has_re('DEPRECATED', caplog)
-    # The value of the new setting shall have been set to the
-    # value of the deprecated one
-    assert default_conf['sectionA']['new_setting'] == 'valB'
-
-    caplog.clear()
-
-    # Assign new setting
-    default_conf['sectionA']['new_setting'] = 'valA'
-    # Delete deprecated setting
-    del default_conf['sectionB']['deprecated_setting']
-    process_deprecated_setting(default_conf,
-                               'sectionA', 'new_setting',
-                               'sectionB', 'deprecated_setting')
-    assert not log_has_re('DEPRECATED', caplog)
-    assert default_conf['sectionA']['new_setting'] == 'valA'
+    assert log_has_re('DEPRECATED', caplog) is deprecated_log
+    assert default_conf['sectionA']['new_setting'] == expected_value